@@ -28,15 +28,32 @@
 # USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 
+import copy
+import functools
 import hashlib
 import importlib
+import inspect
 import json
 import re
+import ssl
+import time
 import urllib.parse
 
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.parsing.convert_bool import boolean
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 
 async def open_session(
     vcenter_hostname=None,
@@ -88,12 +105,29 @@ async def open_session(
         trace_configs = []
 
     auth = aiohttp.BasicAuth(vcenter_username, vcenter_password)
+    # The session is kept in open_session._pool for the lifetime of the
+    # turbo daemon, keep the connections alive long enough to be reused
+    # by the following tasks.
+    connector_args = {
+        "limit": 0,
+        "limit_per_host": 32,
+        "keepalive_timeout": 75,
+        "use_dns_cache": True,
+        "ttl_dns_cache": 300,
+    }
     if validate_certs:
-        connector = aiohttp.TCPConnector(limit=20)
+        if not open_session._ssl_context:
+            open_session._ssl_context = ssl.create_default_context()
+        connector = aiohttp.TCPConnector(
+            ssl=open_session._ssl_context, **connector_args
+        )
     else:
-        connector = aiohttp.TCPConnector(limit=20, ssl=False)
+        connector = aiohttp.TCPConnector(ssl=False, **connector_args)
     async with aiohttp.ClientSession(
-        connector=connector, connector_owner=False, trace_configs=trace_configs
+        connector=connector,
+        connector_owner=False,
+        trace_configs=trace_configs,
+        json_serialize=json_dumps,
     ) as session:
         try:
             async with session.post(
@@ -108,7 +142,7 @@ async def open_session(
                             resp.status, await resp.text()
                         )
                     )
-                json = await resp.json()
+                json = await resp.json(loads=json_loads)
         except aiohttp.client_exceptions.ClientConnectorError as e:
             raise exceptions.EmbeddedModuleFailure(f"Authentication failure: {e}")
 
@@ -118,15 +152,24 @@ async def open_session(
         headers={
             "vmware-api-session-id": session_id,
             "content-type": "application/json",
+            "accept-encoding": "gzip, deflate",
         },
         connector_owner=False,
         trace_configs=trace_configs,
+        json_serialize=json_dumps,
     )
     open_session._pool[digest] = session
     return session
 
 
 open_session._pool = {}
+open_session._ssl_context = None
+
+
+async def read_json(resp):
+    """Parse the body of a small JSON answer in one go."""
+    body = await resp.read()
+    return json_loads(body) if body else {}
 
 
 def gen_args(params, in_query_parameter):
@@ -273,7 +316,7 @@ async def list_devices(session, url):
     pass
 
     async with session.get(url) as resp:
-        _json = await resp.json()
+        _json = await resp.json(loads=json_loads)
         return _json
 
 
@@ -319,7 +362,7 @@ async def get_device_info(session, url, _id):
 
     async with session.get(item_url) as resp:
         if resp.status == 200:
-            _json = await resp.json()
+            _json = await resp.json(loads=json_loads)
             if "value" not in _json:  # 7.0.2+
                 _json = {"value": _json}
             _json["id"] = str(_id)
@@ -367,6 +410,52 @@ async def exists(
             return device
 
 
+def cache_lookup(func):
+    """Keep the result of a read-only lookup in memory for a few seconds.
+
+    The cache is only used when cache_lookup.enabled is set, e.g. by a module
+    running in the turbo server. bust_cache() drops the entries of a given URL.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not cache_lookup.enabled:
+            return await func(*args, **kwargs)
+        arguments = signature.bind(*args, **kwargs).arguments
+        key = (func.__name__, repr(sorted(arguments.items())))
+        now = time.monotonic()
+        entry = cache_lookup._entries.get(key)
+        if entry and now - entry[1] < cache_lookup.ttl:
+            return copy.deepcopy(entry[2])
+
+        value = await func(*args, **kwargs)
+        entries = cache_lookup._entries
+        for k in [k for k, v in entries.items() if now - v[1] >= cache_lookup.ttl]:
+            del entries[k]
+        # None may come from a transient error, e.g: 401 or 503
+        if value is not None:
+            entries[key] = (str(arguments["url"]), now, value)
+        return copy.deepcopy(value)
+
+    return wrapper
+
+
+cache_lookup.enabled = False
+cache_lookup.ttl = 10
+cache_lookup._entries = {}
+
+
+def bust_cache(url_prefix):
+    entries = cache_lookup._entries
+    for k in [k for k, v in entries.items() if v[0].startswith(str(url_prefix))]:
+        del entries[k]
+
+
+cached_get_device_info = cache_lookup(get_device_info)
+cached_exists = cache_lookup(exists)
+
+
 def set_subkey(root, path, value):
     cur_loc = root
     splitted = path.split("/")
@@ -388,6 +477,13 @@ def prepare_payload(params, payload_format):
     return payload
 
 
+def value_matches(new, current):
+    """Tell if the new value of a field is already in the current state."""
+    if isinstance(new, dict) and isinstance(current, dict):
+        return all(current.get(k) == v for k, v in new.items())
+    return new == current or new == {}
+
+
 def get_subdevice_type(url):
     """If url needs a subkey, return its name."""
     candidates = []
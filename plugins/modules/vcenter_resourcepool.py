@@ -168,8 +168,10 @@ author:
 version_added: 0.3.0
 requirements:
 - vSphere 7.0.3 or greater
-- python >= 3.6
+- python >= 3.7
 - aiohttp
+- orjson (optional)
+- uvloop (optional)
 notes:
 - Tested on vSphere 7.0.3
 """
@@ -272,6 +274,8 @@ PAYLOAD_FORMAT = {
         "path": {},
     },
 }  # pylint: disable=line-too-long
+_QUERY_KEYS = {op: tuple(spec["query"]) for op, spec in PAYLOAD_FORMAT.items()}
+_HAS_BODY = {op: bool(spec["body"]) for op, spec in PAYLOAD_FORMAT.items()}
 
 from ansible.module_utils.basic import env_fallback
 
@@ -287,14 +291,19 @@ try:
 except ImportError:
     from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
-    exists,
+    bust_cache,
+    cache_lookup,
+    cached_exists,
+    cached_get_device_info,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
     prepare_payload,
+    read_json,
     session_timeout,
     update_changed_flag,
+    value_matches,
 )
 
 
@@ -348,10 +357,15 @@ def prepare_argument_spec():
     return argument_spec
 
 
+# The spec is the same for every call, build it once for the turbo server
+_ARG_SPEC = prepare_argument_spec()
+
+
 async def main():
     required_if = list([])
 
-    module_args = prepare_argument_spec()
+    # AnsibleModule may add keys to the spec, give it its own copy
+    module_args = dict(_ARG_SPEC)
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
@@ -361,6 +375,8 @@ async def main():
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
+    # Only reuse the lookups across tasks in the long-lived turbo server
+    cache_lookup.enabled = getattr(module, "embedded_in_server", False)
     try:
         session = await open_session(
             vcenter_hostname=module.params["vcenter_hostname"],
@@ -376,14 +392,17 @@ async def main():
 
 
 # template: default_module.j2
-def build_url(params):
-    return ("https://{vcenter_hostname}" "/api/vcenter/resource-pool").format(**params)
+_BASE = "/api/vcenter/resource-pool"
+
+
+def build_url(params, suffix=""):
+    return f"https://{params['vcenter_hostname']}{_BASE}{suffix}"
 
 
 async def entry_point(module, session):
 
     if module.params["state"] == "present":
-        if "_create" in globals():
+        if "create" in _DISPATCH:
             operation = "create"
         else:
             operation = "update"
@@ -392,13 +411,11 @@ async def entry_point(module, session):
     else:
         operation = module.params["state"]
 
-    func = globals()["_" + operation]
-
-    return await func(module.params, session)
+    return await _DISPATCH[operation](module.params, session)
 
 
 async def _create(params, session):
-
+    timeout_args = session_timeout(params)
     lookup_url = per_id_url = build_url(params)
     uniquity_keys = ["resource_pool"]
     comp_func = None
@@ -409,19 +426,21 @@ async def _create(params, session):
         if "name" not in params:
             return
         async with session.get(f"{url}?names={params['name']}{search_filter}") as resp:
-            _json = await resp.json()
+            _json = await read_json(resp)
             if isinstance(_json, list) and len(_json) == 1:
-                return await get_device_info(session, url, _json[0]["resource_pool"])
+                return await cached_get_device_info(
+                    session, url, _json[0]["resource_pool"]
+                )
 
     _json = None
 
     if params["resource_pool"]:
-        _json = await get_device_info(
+        _json = await cached_get_device_info(
             session, build_url(params), params["resource_pool"]
         )
 
     if not _json and (uniquity_keys or comp_func):
-        _json = await exists(
+        _json = await cached_exists(
             params,
             session,
             url=lookup_url,
@@ -436,29 +455,29 @@ async def _create(params, session):
     if _json:
         if "value" not in _json:  # 7.0.2+
             _json = {"value": _json}
-        if "_update" in globals():
+        if "update" in _DISPATCH:
             params["resource_pool"] = _json["id"]
-            return await globals()["_update"](params, session)
+            return await _DISPATCH["update"](params, session)
 
         return await update_changed_flag(_json, 200, "get")
 
     payload = prepare_payload(params, PAYLOAD_FORMAT["create"])
-    _url = ("https://{vcenter_hostname}" "/api/vcenter/resource-pool").format(**params)
-    async with session.post(_url, json=payload, **session_timeout(params)) as resp:
+    _url = build_url(params)
+    async with session.post(_url, json=payload, **timeout_args) as resp:
+        bust_cache(build_url(params))
         if resp.status == 500:
             text = await resp.text()
             raise EmbeddedModuleFailure(
                 f"Request has failed: status={resp.status}, {text}"
             )
-        try:
-            if resp.headers["Content-Type"] == "application/json":
-                _json = await resp.json()
-        except KeyError:
+        if resp.headers.get("Content-Type", "").startswith("application/json"):
+            _json = await read_json(resp)
+        else:
             _json = {}
 
         if (resp.status in [200, 201]) and "error" not in _json:
             if isinstance(_json, str):  # 7.0.2 and greater
-                _id = _json  # TODO: fetch the object
+                _id = _json
             elif isinstance(_json, dict) and "value" not in _json:
                 _id = list(_json["value"].values())[0]
             elif isinstance(_json, dict) and "value" in _json:
@@ -471,49 +490,43 @@ async def _create(params, session):
 
 
 async def _delete(params, session):
-    _in_query_parameters = PAYLOAD_FORMAT["delete"]["query"].keys()
-    payload = prepare_payload(params, PAYLOAD_FORMAT["delete"])
+    timeout_args = session_timeout(params)
+    _in_query_parameters = _QUERY_KEYS["delete"]
+    payload = (
+        prepare_payload(params, PAYLOAD_FORMAT["delete"]) if _HAS_BODY["delete"] else {}
+    )
     subdevice_type = get_subdevice_type("/api/vcenter/resource-pool/{resource_pool}")
     if subdevice_type and not params[subdevice_type]:
-        _json = await exists(params, session, build_url(params))
+        _json = await cached_exists(params, session, build_url(params))
         if _json:
             params[subdevice_type] = _json["id"]
-    _url = (
-        "https://{vcenter_hostname}" "/api/vcenter/resource-pool/{resource_pool}"
-    ).format(**params) + gen_args(params, _in_query_parameters)
-    async with session.delete(_url, json=payload, **session_timeout(params)) as resp:
-        try:
-            if resp.headers["Content-Type"] == "application/json":
-                _json = await resp.json()
-        except KeyError:
+    _url = build_url(params, f"/{params['resource_pool']}") + gen_args(
+        params, _in_query_parameters
+    )
+    async with session.delete(_url, json=payload, **timeout_args) as resp:
+        bust_cache(build_url(params))
+        if resp.headers.get("Content-Type", "").startswith("application/json"):
+            _json = await read_json(resp)
+        else:
             _json = {}
         return await update_changed_flag(_json, resp.status, "delete")
 
 
 async def _update(params, session):
+    timeout_args = session_timeout(params)
     payload = prepare_payload(params, PAYLOAD_FORMAT["update"])
-    _url = (
-        "https://{vcenter_hostname}" "/api/vcenter/resource-pool/{resource_pool}"
-    ).format(**params)
-    async with session.get(_url, **session_timeout(params)) as resp:
-        _json = await resp.json()
+    _url = build_url(params, f"/{params['resource_pool']}")
+    async with session.get(_url, **timeout_args) as resp:
+        _json = await read_json(resp)
         if "value" in _json:
             value = _json["value"]
         else:  # 7.0.2 and greater
             value = _json
-        for k, v in value.items():
-            if k in payload:
-                if isinstance(payload[k], dict) and isinstance(v, dict):
-                    to_delete = True
-                    for _k in list(payload[k].keys()):
-                        if payload[k][_k] != v.get(_k):
-                            to_delete = False
-                    if to_delete:
-                        del payload[k]
-                elif payload[k] == v:
-                    del payload[k]
-                elif payload[k] == {}:
-                    del payload[k]
+        payload = {
+            k: v
+            for k, v in payload.items()
+            if k not in value or not value_matches(v, value[k])
+        }
 
         if payload == {} or payload == {"spec": {}}:
             # Nothing has changed
@@ -521,32 +534,38 @@ async def _update(params, session):
                 _json = {"value": _json}
             _json["id"] = params.get("resource_pool")
             return await update_changed_flag(_json, resp.status, "get")
-    async with session.patch(_url, json=payload, **session_timeout(params)) as resp:
-        try:
-            if resp.headers["Content-Type"] == "application/json":
-                _json = await resp.json()
-        except KeyError:
+    async with session.patch(_url, json=payload, **timeout_args) as resp:
+        bust_cache(build_url(params))
+        if resp.headers.get("Content-Type", "").startswith("application/json"):
+            _json = await read_json(resp)
+        else:
             _json = {}
-        if "value" not in _json:  # 7.0.2
-            _json = {"value": _json}
 
         # e.g: content_configuration
+        # Only read the resource again if the PATCH answer has no body
         if not _json and resp.status == 204:
-            async with session.get(_url, **session_timeout(params)) as resp_get:
-                _json_get = await resp_get.json()
+            async with session.get(_url, **timeout_args) as resp_get:
+                _json_get = await read_json(resp_get)
                 if _json_get:
                     _json = _json_get
+        if "value" not in _json:  # 7.0.2
+            _json = {"value": _json}
 
         _json["id"] = params.get("resource_pool")
         return await update_changed_flag(_json, resp.status, "update")
 
 
+_DISPATCH = {"create": _create, "update": _update, "delete": _delete}
+
+
 if __name__ == "__main__":
     import asyncio
 
-    current_loop = asyncio.new_event_loop()
     try:
-        asyncio.set_event_loop(current_loop)
-        current_loop.run_until_complete(main())
-    finally:
-        current_loop.close()
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    asyncio.run(main())
@@ -18,6 +18,14 @@ options:
         - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_hardware_adapter_scsi).
             Required with I(state=['get'])
         type: str
+    adapters:
+        description:
+        - A list of virtual SCSI adapter identifiers to collect at once.
+        - The module then always returns a list, in the same order, and each entry
+            comes with its C(id).
+        - Mutually exclusive with I(adapter) and I(label).
+        elements: str
+        type: list
     label:
         description:
         - The name of the item
@@ -79,8 +87,10 @@ author:
 version_added: 0.1.0
 requirements:
 - vSphere 7.0.3 or greater
-- python >= 3.6
+- python >= 3.7
 - aiohttp
+- orjson (optional)
+- uvloop (optional)
 notes:
 - Tested on vSphere 7.0.3
 """
@@ -101,11 +111,21 @@ EXAMPLES = r"""
   vmware.vmware_rest.vcenter_vm_hardware_adapter_scsi_info:
     vm: '{{ test_vm1_info.id }}'
   register: _result
+
+- name: Collect information about two SCSI adapters of a given VM
+  vmware.vmware_rest.vcenter_vm_hardware_adapter_scsi_info:
+    vm: '{{ test_vm1_info.id }}'
+    adapters:
+    - '1000'
+    - '1001'
+  register: _result
 """
 RETURN = r"""
 # content generated by the update_return_section callback# task: List the SCSI adapter of a given VM
 value:
-  description: List the SCSI adapter of a given VM
+  description:
+  - List the SCSI adapter of a given VM
+  - With I(adapters), the list of the requested adapters, each one with its C(id).
   returned: On success
   sample:
   - adapter: '1000'
@@ -118,6 +138,7 @@ PAYLOAD_FORMAT = {
     "get": {"query": {}, "body": {}, "path": {"adapter": "adapter", "vm": "vm"}},
     "list": {"query": {}, "body": {}, "path": {"vm": "vm"}},
 }  # pylint: disable=line-too-long
+_QUERY_KEYS = {op: tuple(spec["query"]) for op, spec in PAYLOAD_FORMAT.items()}
 
 from ansible.module_utils.basic import env_fallback
 
@@ -137,6 +158,7 @@ from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest imp
     exists,
     gen_args,
     open_session,
+    read_json,
     session_timeout,
     update_changed_flag,
 )
@@ -179,18 +201,28 @@ def prepare_argument_spec():
     }
 
     argument_spec["adapter"] = {"type": "str"}
+    argument_spec["adapters"] = {"type": "list", "elements": "str"}
     argument_spec["label"] = {"type": "str"}
     argument_spec["vm"] = {"required": True, "type": "str"}
 
     return argument_spec
 
 
+# The spec is the same for every call, build it once for the turbo server
+_ARG_SPEC = prepare_argument_spec()
+
+
 async def main():
     required_if = list([])
+    mutually_exclusive = [["adapter", "adapters"], ["label", "adapters"]]
 
-    module_args = prepare_argument_spec()
+    # AnsibleModule may add keys to the spec, give it its own copy
+    module_args = dict(_ARG_SPEC)
     module = AnsibleModule(
-        argument_spec=module_args, required_if=required_if, supports_check_mode=True
+        argument_spec=module_args,
+        required_if=required_if,
+        mutually_exclusive=mutually_exclusive,
+        supports_check_mode=True,
     )
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
@@ -216,31 +248,33 @@ async def main():
 def build_url(params):
     import yarl
 
+    base = (
+        f"https://{params['vcenter_hostname']}"
+        f"/api/vcenter/vm/{params['vm']}/hardware/adapter/scsi"
+    )
     if params.get("adapter"):
-        _in_query_parameters = PAYLOAD_FORMAT["get"]["query"].keys()
+        _in_query_parameters = _QUERY_KEYS["get"]
         return yarl.URL(
-            (
-                "https://{vcenter_hostname}"
-                "/api/vcenter/vm/{vm}/hardware/adapter/scsi/"
-            ).format(**params)
-            + params["adapter"]
-            + gen_args(params, _in_query_parameters),
+            base + "/" + params["adapter"] + gen_args(params, _in_query_parameters),
             encoded=True,
         )
-    _in_query_parameters = PAYLOAD_FORMAT["list"]["query"].keys()
+    _in_query_parameters = _QUERY_KEYS["list"]
     return yarl.URL(
-        (
-            "https://{vcenter_hostname}" "/api/vcenter/vm/{vm}/hardware/adapter/scsi"
-        ).format(**params)
-        + gen_args(params, _in_query_parameters),
+        base + gen_args(params, _in_query_parameters),
         encoded=True,
     )
 
 
 async def entry_point(module, session):
+    if module.params.get("adapters"):
+        return await get_adapters(module.params, session, module.params["adapters"])
+
     url = build_url(module.params)
     async with session.get(url, **session_timeout(module.params)) as resp:
-        _json = await resp.json()
+        if resp.headers.get("Content-Type", "").startswith("application/json"):
+            _json = await read_json(resp)
+        else:
+            _json = {}
 
         if "value" not in _json:  # 7.0.2+
             _json = {"value": _json}
@@ -261,12 +295,39 @@ async def entry_point(module, session):
         return await update_changed_flag(_json, resp.status, "get")
 
 
+async def get_adapters(params, session, adapters):
+    import asyncio
+
+    timeout_args = session_timeout(params)
+
+    async def get_adapter(adapter):
+        url = build_url(dict(params, adapter=adapter))
+        async with session.get(url, **timeout_args) as resp:
+            if resp.headers.get("Content-Type", "").startswith("application/json"):
+                _json = await read_json(resp)
+            else:
+                _json = {}
+            if isinstance(_json, dict) and "value" in _json:  # 7.0.2 <
+                _json = _json["value"]
+            if not isinstance(_json, dict):
+                _json = {"value": _json}
+            return resp.status, dict(_json, id=adapter)
+
+    results = await asyncio.gather(*(get_adapter(i) for i in adapters))
+    status = next((s for s, _ in results if s != 200), 200)
+    return await update_changed_flag(
+        {"value": [_json for _, _json in results]}, status, "get"
+    )
+
+
 if __name__ == "__main__":
     import asyncio
 
-    current_loop = asyncio.new_event_loop()
     try:
-        asyncio.set_event_loop(current_loop)
-        current_loop.run_until_complete(main())
-    finally:
-        current_loop.close()
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from ansible_collections.vmware.vmware_rest.plugins.module_utils import vmware_rest
+
+URL = "https://vcenter/api/vcenter/resource-pool"
+
+
+@pytest.fixture
+def lookup(monkeypatch):
+    monkeypatch.setattr(vmware_rest.cache_lookup, "enabled", True)
+    monkeypatch.setattr(vmware_rest.cache_lookup, "_entries", {})
+    clock = [100.0]
+    monkeypatch.setattr(vmware_rest.time, "monotonic", lambda: clock[0])
+    calls = []
+
+    async def get_device_info(session, url, _id):
+        calls.append(_id)
+        if _id == "missing":
+            return None
+        return {"value": {"name": _id}, "id": _id}
+
+    cached = vmware_rest.cache_lookup(get_device_info)
+    return cached, calls, clock
+
+
+def run(cached, url=URL, _id="resgroup-1"):
+    return asyncio.run(cached("session", url, _id))
+
+
+def test_cache_lookup_hit(lookup):
+    cached, calls, clock = lookup
+    first = run(cached)
+    first["value"]["name"] = "modified"
+    clock[0] += 5
+    assert run(cached) == {"value": {"name": "resgroup-1"}, "id": "resgroup-1"}
+    assert calls == ["resgroup-1"]
+    assert cached.__name__ == "get_device_info"
+
+
+def test_cache_lookup_expiry(lookup):
+    cached, calls, clock = lookup
+    run(cached)
+    clock[0] += vmware_rest.cache_lookup.ttl
+    run(cached)
+    assert calls == ["resgroup-1", "resgroup-1"]
+
+
+def test_cache_lookup_skips_none(lookup):
+    cached, calls, clock = lookup
+    assert run(cached, _id="missing") is None
+    assert run(cached, _id="missing") is None
+    assert calls == ["missing", "missing"]
+
+
+def test_cache_lookup_disabled(lookup, monkeypatch):
+    cached, calls, clock = lookup
+    monkeypatch.setattr(vmware_rest.cache_lookup, "enabled", False)
+    run(cached)
+    run(cached)
+    assert calls == ["resgroup-1", "resgroup-1"]
+
+
+def test_bust_cache(lookup):
+    cached, calls, clock = lookup
+    run(cached)
+    run(cached, url="https://vcenter/api/vcenter/folder")
+    vmware_rest.bust_cache(URL)
+    run(cached)
+    run(cached, url="https://vcenter/api/vcenter/folder")
+    assert calls == ["resgroup-1", "resgroup-1", "resgroup-1"]